@@ -5,12 +5,21 @@ GlowBarn CLI - Command Line Interface for GlowBarn OS
 
 import os
 import sys
+import time
+import heapq
+import socket
 import argparse
-import yaml
-import json
+import platform
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Add our lib path
+sys.path.insert(0, '/opt/glowbarn/lib')
+
+import glowbarn_config
+
 CONFIG_PATH = Path("/etc/glowbarn/config.yaml")
 DATA_PATH = Path("/opt/glowbarn/data")
 LOG_PATH = Path("/opt/glowbarn/logs")
@@ -23,10 +32,7 @@ BANNER = """
 
 def load_config():
     """Load configuration from YAML file."""
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, 'r') as f:
-            return yaml.safe_load(f)
-    return {}
+    return glowbarn_config.load_config(CONFIG_PATH) or {}
 
 
 def cmd_status(args):
@@ -34,83 +40,192 @@ def cmd_status(args):
     print("\n📊 GlowBarn System Status")
     print("─" * 50)
     
-    # Check if main service is running
-    import subprocess
-    result = subprocess.run(['systemctl', 'is-active', 'glowbarn'], 
-                          capture_output=True, text=True)
-    service_status = result.stdout.strip()
-    
-    print(f"  Main Service: {'✅ Running' if service_status == 'active' else '❌ Stopped'}")
-    
-    # Check sensors service
-    result = subprocess.run(['systemctl', 'is-active', 'glowbarn-sensors'], 
-                          capture_output=True, text=True)
-    sensors_status = result.stdout.strip()
-    print(f"  Sensors Service: {'✅ Running' if sensors_status == 'active' else '❌ Stopped'}")
-    
-    # System info
-    import platform
-    print(f"\n  Hostname: {platform.node()}")
-    print(f"  Platform: {platform.machine()}")
-    print(f"  OS: GlowBarn OS v1.0.0")
-    
-    # Disk usage
-    import shutil
-    total, used, free = shutil.disk_usage("/")
-    print(f"\n  Disk: {used // (2**30):.1f}GB / {total // (2**30):.1f}GB ({100*used/total:.1f}%)")
-    
-    # Memory
-    try:
-        with open('/proc/meminfo', 'r') as f:
-            meminfo = f.read()
-        for line in meminfo.split('\n'):
-            if 'MemTotal' in line:
-                mem_total = int(line.split()[1]) // 1024
-            if 'MemAvailable' in line:
-                mem_avail = int(line.split()[1]) // 1024
-        print(f"  Memory: {mem_total - mem_avail}MB / {mem_total}MB")
-    except:
-        pass
-        
-    # Network
-    try:
-        import socket
-        hostname = socket.gethostname()
-        ip = socket.gethostbyname(hostname)
-        print(f"\n  IP Address: {ip}")
-    except:
-        pass
-        
+    def probe_services():
+        # Check both services with a single systemctl call; it accepts
+        # multiple units and prints one status per line.
+        result = subprocess.run(['systemctl', 'is-active', 'glowbarn', 'glowbarn-sensors'],
+                              capture_output=True, text=True)
+        statuses = result.stdout.splitlines()
+        main_status = statuses[0].strip() if len(statuses) > 0 else 'unknown'
+        sensors_status = statuses[1].strip() if len(statuses) > 1 else 'unknown'
+        return main_status, sensors_status
+
+    def probe_disk():
+        # One statvfs syscall; shutil.disk_usage wraps the same call but
+        # allocates a namedtuple on top.
+        s = os.statvfs("/")
+        total = s.f_blocks * s.f_frsize
+        free = s.f_bavail * s.f_frsize
+        return total, total - free, free
+
+    def probe_memory():
+        # Scan /proc/meminfo line by line and stop once both fields are
+        # found; both live near the top, so this avoids reading and
+        # splitting the whole file. Bytes mode skips the decode step.
+        mem_total = mem_avail = None
+        with open('/proc/meminfo', 'rb') as f:
+            for line in f:
+                if line.startswith(b'MemTotal:'):
+                    mem_total = int(line.split()[1]) // 1024
+                elif line.startswith(b'MemAvailable:'):
+                    mem_avail = int(line.split()[1]) // 1024
+                if mem_total is not None and mem_avail is not None:
+                    break
+        return mem_total, mem_avail
+
+    def probe_ip():
+        # Connecting a UDP socket never sends a packet but makes the
+        # kernel pick the outbound interface, whose address we read
+        # back - no DNS, no blocking, and unlike
+        # gethostbyname(gethostname()) it doesn't return 127.0.1.1 on
+        # Debian-style hosts.
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                s.connect(('10.255.255.255', 1))
+                return s.getsockname()[0]
+            finally:
+                s.close()
+        except OSError:
+            return socket.gethostbyname(socket.gethostname())
+
+    # Run the independent probes concurrently so wall clock is the
+    # slowest probe, not the sum of all of them. The DNS lookup alone
+    # can take seconds on a misconfigured host; this hides it behind
+    # the systemctl call.
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        f_services = pool.submit(probe_services)
+        f_disk = pool.submit(probe_disk)
+        f_memory = pool.submit(probe_memory)
+        f_ip = pool.submit(probe_ip)
+
+        service_status, sensors_status = f_services.result()
+        print(f"  Main Service: {'✅ Running' if service_status == 'active' else '❌ Stopped'}")
+        print(f"  Sensors Service: {'✅ Running' if sensors_status == 'active' else '❌ Stopped'}")
+
+        # System info
+        print(f"\n  Hostname: {platform.node()}")
+        print(f"  Platform: {platform.machine()}")
+        print(f"  OS: GlowBarn OS v1.0.0")
+
+        # Disk usage
+        total, used, free = f_disk.result()
+        print(f"\n  Disk: {used // (2**30):.1f}GB / {total // (2**30):.1f}GB ({100*used/total:.1f}%)")
+
+        # Memory
+        try:
+            mem_total, mem_avail = f_memory.result()
+            print(f"  Memory: {mem_total - mem_avail}MB / {mem_total}MB")
+        except:
+            pass
+
+        # Network
+        try:
+            ip = f_ip.result()
+            print(f"\n  IP Address: {ip}")
+        except:
+            pass
+
     print("")
 
 
+# Fixed sensor order; bit i of the enabled mask refers to SENSOR_ORDER[i]
+SENSOR_ORDER = ('emf', 'temperature', 'humidity', 'motion', 'vibration', 'pressure')
+
+# Row templates built once, not per repaint
+_SENSOR_ROW = "  {:12} {:>12}  {}"
+_SENSOR_ROW_DISABLED = "  {:12} {:>12}"
+
+
+def _enabled_mask(sensors_config):
+    """Pack per-sensor 'enabled' flags into one int, bit per sensor."""
+    return sum(
+        1 << i for i, name in enumerate(SENSOR_ORDER)
+        if sensors_config.get(name, {}).get('enabled', False))
+
+
 def cmd_sensors(args):
     """Show current sensor readings."""
-    print("\n📡 Current Sensor Readings")
-    print("─" * 50)
-    
     config = load_config()
-    sensors_config = config.get('sensors', {})
-    
-    # Placeholder readings - in production would read actual sensors
-    readings = {
-        'emf': {'value': 0.3, 'unit': 'mG', 'status': '✅ Normal'},
-        'temperature': {'value': 68.5, 'unit': '°F', 'status': '✅ Normal'},
-        'humidity': {'value': 45, 'unit': '%', 'status': '✅ Normal'},
-        'motion': {'value': False, 'unit': '', 'status': '✅ No motion'},
-        'vibration': {'value': 0.01, 'unit': 'g', 'status': '✅ Stable'},
-        'pressure': {'value': 1013.25, 'unit': 'hPa', 'status': '✅ Normal'}
-    }
-    
-    for sensor, data in readings.items():
-        if sensors_config.get(sensor, {}).get('enabled', False):
-            value_str = f"{data['value']}{data['unit']}" if data['unit'] else str(data['value'])
-            print(f"  {sensor.upper():12} {value_str:>12}  {data['status']}")
-        else:
-            print(f"  {sensor.upper():12} {'Disabled':>12}")
-    
-    print(f"\n  Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("")
+    # One bitmask computed per config load; the render loop tests a bit
+    # per sensor instead of two dict lookups per row per repaint.
+    mask = _enabled_mask(config.get('sensors', {}))
+
+    def render():
+        print("\n📡 Current Sensor Readings")
+        print("─" * 50)
+
+        # Placeholder readings - in production would read actual sensors
+        readings = {
+            'emf': {'value': 0.3, 'unit': 'mG', 'status': '✅ Normal'},
+            'temperature': {'value': 68.5, 'unit': '°F', 'status': '✅ Normal'},
+            'humidity': {'value': 45, 'unit': '%', 'status': '✅ Normal'},
+            'motion': {'value': False, 'unit': '', 'status': '✅ No motion'},
+            'vibration': {'value': 0.01, 'unit': 'g', 'status': '✅ Stable'},
+            'pressure': {'value': 1013.25, 'unit': 'hPa', 'status': '✅ Normal'}
+        }
+
+        for i, sensor in enumerate(SENSOR_ORDER):
+            data = readings[sensor]
+            if mask >> i & 1:
+                value_str = f"{data['value']}{data['unit']}" if data['unit'] else str(data['value'])
+                print(_SENSOR_ROW.format(sensor.upper(), value_str, data['status']))
+            else:
+                print(_SENSOR_ROW_DISABLED.format(sensor.upper(), 'Disabled'))
+
+        print(f"\n  Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print("")
+
+    if args.watch:
+        try:
+            while True:
+                render()
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print("")
+    else:
+        render()
+
+
+def _scan_sessions():
+    """One-pass scan of the session data directory.
+
+    Returns [(name, mtime)] for every session directory. A single
+    scandir walk yields d_type and a cached stat per entry, so 'record
+    list' and 'export' share one directory pass instead of re-walking
+    and stat'ing per use.
+    """
+    sessions = []
+    try:
+        with os.scandir(DATA_PATH) as it:
+            for entry in it:
+                if entry.is_dir():
+                    sessions.append((entry.name, entry.stat().st_mtime))
+    except FileNotFoundError:
+        pass
+    return sessions
+
+
+def _read_manifests(names):
+    """Read every session's manifest.json as one concurrent batch.
+
+    The reads are independent, so submitting them together lets the
+    kernel overlap the I/O instead of serializing N open/read pairs.
+    Sessions without a manifest are skipped.
+    """
+    def read_one(name):
+        with open(DATA_PATH / name / 'manifest.json', 'rb') as f:
+            return f.read()
+
+    manifests = {}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {name: pool.submit(read_one, name) for name in names}
+        for name, future in futures.items():
+            try:
+                manifests[name] = future.result()
+            except OSError:
+                continue
+    return manifests
 
 
 def cmd_record(args):
@@ -128,7 +243,6 @@ def cmd_record(args):
         
         # In production, this would start the actual recording
         try:
-            import time
             while True:
                 time.sleep(1)
         except KeyboardInterrupt:
@@ -141,12 +255,12 @@ def cmd_record(args):
         
     elif args.action == 'list':
         print("  Recent Sessions:")
-        # List sessions from data directory
-        if DATA_PATH.exists():
-            sessions = sorted(DATA_PATH.iterdir(), reverse=True)[:10]
-            for session in sessions:
-                if session.is_dir():
-                    print(f"    - {session.name}")
+        # nlargest keeps only the 10 newest sessions instead of sorting
+        # the whole directory.
+        sessions = heapq.nlargest(10, _scan_sessions(), key=lambda s: s[1])
+        if sessions:
+            for name, _mtime in sessions:
+                print(f"    - {name}")
         else:
             print("    No sessions found")
     
@@ -161,17 +275,14 @@ def cmd_config(args):
     config = load_config()
     
     if args.action == 'show':
-        print(yaml.dump(config, default_flow_style=False, indent=2))
+        print(glowbarn_config.safe_dump(config, default_flow_style=False,
+                                        indent=2))
     elif args.action == 'edit':
-        import subprocess
         editor = os.environ.get('EDITOR', 'nano')
         subprocess.run([editor, str(CONFIG_PATH)])
     elif args.action == 'get':
         if args.key:
-            keys = args.key.split('.')
-            value = config
-            for k in keys:
-                value = value.get(k, {})
+            value = glowbarn_config.get_key(args.key, default={})
             print(f"  {args.key} = {value}")
     elif args.action == 'set':
         if args.key and args.value:
@@ -182,33 +293,47 @@ def cmd_config(args):
     print("")
 
 
+def _tail_lines(path, n, chunk_size=8192):
+    """Return the last n lines of a file as decoded strings.
+
+    Seeks to the end and walks backward in fixed-size chunks, counting
+    newlines until n are collected - constant memory and typically a
+    single disk read, regardless of how large the log has grown.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        pos = f.tell()
+        buf = b''
+        while pos > 0 and buf.count(b'\n') <= n:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    return [line.decode(errors='replace') for line in buf.splitlines()[-n:]]
+
+
 def cmd_logs(args):
     """View system logs."""
     print("\n📜 System Logs")
     print("─" * 50)
-    
+
     log_file = LOG_PATH / "glowbarn.log"
-    
+
     if args.follow:
-        import subprocess
         subprocess.run(['tail', '-f', str(log_file)])
     else:
         lines = args.lines or 20
         try:
-            with open(log_file, 'r') as f:
-                log_lines = f.readlines()[-lines:]
-                for line in log_lines:
-                    print(f"  {line.rstrip()}")
+            for line in _tail_lines(log_file, lines):
+                print(f"  {line.rstrip()}")
         except FileNotFoundError:
             print("  No logs found")
-    
+
     print("")
 
 
 def cmd_service(args):
     """Manage services."""
-    import subprocess
-    
     service = args.service or 'glowbarn'
     action = args.action
     
@@ -241,8 +366,12 @@ def cmd_export(args):
     
     print(f"  Format: {format_type}")
     print(f"  Output: {output}")
+
+    sessions = _scan_sessions()
+    manifests = _read_manifests(name for name, _mtime in sessions)
+    print(f"  Sessions: {len(sessions)} ({len(manifests)} with manifests)")
     print("  Exporting...")
-    
+
     # Placeholder for actual export
     print(f"  ✅ Export complete: {output}")
     print("")
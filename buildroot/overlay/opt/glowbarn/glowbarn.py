@@ -13,16 +13,20 @@ A comprehensive paranormal investigation platform with:
 
 import os
 import sys
-import yaml
+import gzip
+import time
 import signal
 import logging
 import asyncio
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 
 # Add our lib path
 sys.path.insert(0, '/opt/glowbarn/lib')
 
+import glowbarn_config
+
 __version__ = "1.0.0"
 __author__ = "Bad Antics"
 __app_name__ = "GlowBarn"
@@ -51,28 +55,34 @@ LOG_PATH = Path("/opt/glowbarn/logs")
 
 # Global state
 running = True
-config = {}
+config = glowbarn_config.GlowbarnConfig()
 sensors = {}
 web_server = None
 
+# orjson serializes 3-10x faster than stdlib json and emits bytes
+# directly (no extra encode step); fall back to json where it isn't
+# packaged for the target.
+try:
+    import orjson
+
+    def _json_bytes(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _json_bytes(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Monotonic -> wall-clock offset, captured once at startup. The sensor
+# loop stores cheap monotonic ticks; the offset is applied only when a
+# timestamp is actually formatted for a client.
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
 
 def load_config():
-    """Load configuration from YAML file."""
+    """Load configuration into a structured GlowbarnConfig."""
     global config
-    
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH, 'r') as f:
-            config = yaml.safe_load(f)
-    else:
-        config = {
-            'web': {'enabled': True, 'port': 8765, 'host': '0.0.0.0'},
-            'sensors': {},
-            'audio': {'evp_detection': {'enabled': False}},
-            'camera': {'enabled': False},
-            'logging': {'level': 'INFO'},
-            'alerts': {'enabled': True}
-        }
-    
+    config = glowbarn_config.load_structured(CONFIG_PATH)
     return config
 
 
@@ -80,8 +90,8 @@ def setup_logging():
     """Configure logging system."""
     LOG_PATH.mkdir(parents=True, exist_ok=True)
     
-    log_level = getattr(logging, config.get('logging', {}).get('level', 'INFO'))
-    log_file = config.get('logging', {}).get('file', str(LOG_PATH / 'glowbarn.log'))
+    log_level = getattr(logging, config.logging.level, logging.INFO)
+    log_file = config.logging.file or str(LOG_PATH / 'glowbarn.log')
     
     logging.basicConfig(
         level=log_level,
@@ -102,88 +112,176 @@ def signal_handler(signum, frame):
     running = False
 
 
+class SysfsBatchReader:
+    """Batched reader for sysfs-backed sensor values.
+
+    Sensor files (/sys/class/iio/.../in_*_raw, /sys/bus/w1/.../w1_slave)
+    are opened once at initialization and re-read each cycle with
+    os.pread at offset 0, so a poll cycle costs one read syscall per
+    sensor instead of an open/read/close triple. The cycle loop is
+    deliberately shaped like an io_uring submission batch: with a
+    liburing binding the pread loop becomes a single submit-and-wait
+    over the same pre-registered fds.
+    """
+
+    def __init__(self, paths):
+        self._fds = {}
+        self.logger = logging.getLogger('sensors.reader')
+        for name, path in paths.items():
+            try:
+                self._fds[name] = os.open(path, os.O_RDONLY)
+            except OSError as e:
+                self.logger.warning(f"Cannot open {path} for {name}: {e}")
+
+    def read_all(self):
+        """Read every registered sensor file. Returns {name: bytes}."""
+        return {name: os.pread(fd, 64, 0) for name, fd in self._fds.items()}
+
+    def close(self):
+        """Release all sensor file descriptors."""
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+
+
+class ReadingRingBuffer:
+    """Lock-free single-writer ring buffer of sensor reading rows.
+
+    Backed by multiprocessing.shared_memory so the web dashboard, EVP
+    detector and exporters can all map the same pages and read the
+    latest row without per-subscriber dict copies or queues. Layout:
+    one cache line holding a uint64 write counter, then SLOTS int64
+    timestamps (ns), then SLOTS x N float64 values. Only the monitoring
+    loop writes; the counter is bumped after the row is complete, so
+    readers of the previous slot never observe a torn row.
+    """
+
+    HEADER_BYTES = 64  # keep the write counter on its own cache line
+
+    def __init__(self, n_sensors, slots=256, name=None):
+        from multiprocessing import shared_memory
+
+        self.slots = slots
+        self.n_sensors = n_sensors
+        size = self.HEADER_BYTES + slots * 8 + slots * n_sensors * 8
+        self._shm = shared_memory.SharedMemory(
+            create=name is None, name=name, size=size)
+        self._counter = np.ndarray((1,), dtype=np.uint64,
+                                   buffer=self._shm.buf)
+        self._timestamps = np.ndarray((slots,), dtype=np.int64,
+                                      buffer=self._shm.buf,
+                                      offset=self.HEADER_BYTES)
+        self._values = np.ndarray((slots, n_sensors), dtype=np.float64,
+                                  buffer=self._shm.buf,
+                                  offset=self.HEADER_BYTES + slots * 8)
+        if name is None:
+            self._counter[0] = 0
+
+    @property
+    def name(self):
+        """Shared memory segment name, for attaching readers."""
+        return self._shm.name
+
+    def write(self, ts_ns, values):
+        """Publish one reading row (writer side only)."""
+        idx = int(self._counter[0]) % self.slots
+        self._timestamps[idx] = ts_ns
+        self._values[idx] = values
+        self._counter[0] += 1
+
+    def latest(self):
+        """Return (ts_ns, values) for the newest row, or None if empty."""
+        count = int(self._counter[0])
+        if count == 0:
+            return None
+        idx = (count - 1) % self.slots
+        return int(self._timestamps[idx]), self._values[idx].copy()
+
+    def close(self):
+        """Detach and remove the shared memory segment."""
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
 class SensorManager:
-    """Manages all connected sensors."""
-    
+    """Manages all connected sensors.
+
+    Sensor values live in a structure-of-arrays layout: one preallocated
+    numpy array for values with a fixed index per sensor, plus parallel
+    name/unit lists. Readers update the value array in place instead of
+    allocating a dict per sensor per 100 ms tick.
+    """
+
     def __init__(self, config):
-        self.config = config.get('sensors', {})
+        self.config = config.sensors
         self.sensors = {}
         self.logger = logging.getLogger('sensors')
-        
+        # SoA buffers, sized in initialize() once sensors are known
+        self._names = []
+        self._units = []
+        self._values = np.zeros(0, dtype=np.float32)
+        self._index = {}
+        self._reader = None
+        self.ring = None
+
     async def initialize(self):
         """Initialize all configured sensors."""
         self.logger.info("Initializing sensors...")
-        
-        # EMF Sensor
-        if self.config.get('emf', {}).get('enabled'):
-            self.logger.info("  - EMF sensor enabled")
-            self.sensors['emf'] = {
-                'pin': self.config['emf'].get('pin', 17),
-                'sample_rate': self.config['emf'].get('sample_rate', 100),
-                'value': 0.0
-            }
-            
-        # Temperature Sensor
-        if self.config.get('temperature', {}).get('enabled'):
-            self.logger.info("  - Temperature sensor enabled")
-            self.sensors['temperature'] = {
-                'type': self.config['temperature'].get('type', 'ds18b20'),
-                'pin': self.config['temperature'].get('pin', 4),
-                'value': 0.0
-            }
-            
-        # Humidity Sensor
-        if self.config.get('humidity', {}).get('enabled'):
-            self.logger.info("  - Humidity sensor enabled")
-            self.sensors['humidity'] = {
-                'type': self.config['humidity'].get('type', 'dht22'),
-                'pin': self.config['humidity'].get('pin', 22),
-                'value': 0.0
-            }
-            
-        # Motion Sensor
-        if self.config.get('motion', {}).get('enabled'):
-            self.logger.info("  - Motion sensor enabled")
-            self.sensors['motion'] = {
-                'pin': self.config['motion'].get('pin', 27),
-                'value': False
-            }
-            
-        # Vibration Sensor
-        if self.config.get('vibration', {}).get('enabled'):
-            self.logger.info("  - Vibration sensor enabled")
-            self.sensors['vibration'] = {
-                'pin': self.config['vibration'].get('pin', 23),
-                'value': 0.0
-            }
-            
-        # Pressure Sensor
-        if self.config.get('pressure', {}).get('enabled'):
-            self.logger.info("  - Pressure sensor enabled")
-            self.sensors['pressure'] = {
-                'type': self.config['pressure'].get('type', 'bmp280'),
-                'i2c_address': self.config['pressure'].get('i2c_address', 0x76),
-                'value': 0.0
-            }
-            
+
+        for name in ('emf', 'temperature', 'humidity', 'motion',
+                     'vibration', 'pressure'):
+            sensor_cfg = getattr(self.config, name)
+            if sensor_cfg.enabled:
+                self.logger.info(f"  - {name.capitalize()} sensor enabled")
+                self.sensors[name] = sensor_cfg
+
+        # Allocate the SoA buffers with a fixed slot per sensor
+        self._names = list(self.sensors.keys())
+        self._units = [self._get_unit(name) for name in self._names]
+        self._values = np.zeros(len(self._names), dtype=np.float32)
+        self._index = {name: i for i, name in enumerate(self._names)}
+
+        # Sensors backed by a sysfs file (configured via 'path') are
+        # read through the batch reader, which keeps their fds open
+        # across cycles.
+        paths = {
+            name: sensor_cfg.path
+            for name, sensor_cfg in self.sensors.items()
+            if sensor_cfg.path
+        }
+        if paths:
+            self._reader = SysfsBatchReader(paths)
+
+        if self._names:
+            self.ring = ReadingRingBuffer(len(self._names))
+
         self.logger.info(f"Initialized {len(self.sensors)} sensors")
         
     async def read_all(self):
         """Read current values from all sensors."""
-        readings = {
-            'timestamp': datetime.now().isoformat(),
-            'sensors': {}
-        }
-        
-        for name, sensor in self.sensors.items():
-            # Placeholder for actual sensor reading
-            # In production, this would read from GPIO/I2C/etc.
-            readings['sensors'][name] = {
-                'value': sensor.get('value', 0),
-                'unit': self._get_unit(name)
+        # Snapshot the newest published ring row (no lock, no dict
+        # copies); fall back to the live SoA buffer before the first
+        # monitoring cycle has run.
+        latest = self.ring.latest() if self.ring else None
+        if latest is not None:
+            ts_ns, values = latest
+            # Format once per response, not per reading in the loop
+            timestamp = datetime.fromtimestamp(
+                (ts_ns + _EPOCH_OFFSET_NS) / 1e9).isoformat()
+        else:
+            values = self._values
+            timestamp = datetime.now().isoformat()
+
+        return {
+            'timestamp': timestamp,
+            'sensors': {
+                name: {'value': float(value), 'unit': unit}
+                for name, value, unit in zip(self._names, values, self._units)
             }
-            
-        return readings
+        }
     
     def _get_unit(self, sensor_name):
         """Get the unit for a sensor type."""
@@ -200,123 +298,202 @@ class SensorManager:
     async def start_monitoring(self):
         """Start continuous sensor monitoring loop."""
         while running:
-            readings = await self.read_all()
-            # Store/broadcast readings
+            if self._reader is not None:
+                for name, raw in self._reader.read_all().items():
+                    try:
+                        self._values[self._index[name]] = float(raw.strip())
+                    except ValueError:
+                        self.logger.debug(f"Unparseable reading from {name}")
+            if self.ring is not None:
+                self.ring.write(time.monotonic_ns(), self._values)
             await asyncio.sleep(0.1)  # 10 Hz sampling
 
+        if self._reader is not None:
+            self._reader.close()
+        if self.ring is not None:
+            self.ring.close()
+
+
+# scipy's pocketfft uses SIMD kernels and can split work across cores;
+# fall back to numpy's rfft when scipy isn't built for the target.
+try:
+    from scipy.fft import rfft as _rfft
+except ImportError:
+    _rfft = np.fft.rfft
+
+
+def _detect_anomaly(band_energy, baseline, threshold_ratio, in_event):
+    """Rolling-baseline hysteresis detector for one spectral frame.
+
+    Each frame depends on the previous baseline, so this is inherently
+    scalar; numba JIT-compiles it to native code when available.
+    """
+    baseline = 0.99 * baseline + 0.01 * band_energy
+    if in_event:
+        # Lower threshold to leave an event than to enter one
+        in_event = band_energy > baseline * (threshold_ratio * 0.5)
+    else:
+        in_event = band_energy > baseline * threshold_ratio
+    return baseline, in_event
+
+
+try:
+    import numba
+    _detect_anomaly = numba.njit(cache=True, fastmath=True)(_detect_anomaly)
+except ImportError:
+    pass
+
 
 class EVPDetector:
     """Electronic Voice Phenomena detection system."""
-    
+
+    # Human voice band scanned for anomalous energy
+    VOICE_BAND_HZ = (300.0, 3400.0)
+
     def __init__(self, config):
-        self.config = config.get('audio', {}).get('evp_detection', {})
+        self.config = config.audio.evp_detection
         self.logger = logging.getLogger('evp')
         self.recording = False
-        
+        self._baseline = 0.0
+        self._in_event = False
+
     async def initialize(self):
         """Initialize audio capture system."""
-        if not self.config.get('enabled'):
+        if not self.config.enabled:
             self.logger.info("EVP detection disabled")
             return
-            
+
         self.logger.info("Initializing EVP detection...")
-        self.logger.info(f"  - Sample rate: {self.config.get('sample_rate', 44100)}")
-        self.logger.info(f"  - Channels: {self.config.get('channels', 2)}")
-        
+        self.logger.info(f"  - Sample rate: {self.config.sample_rate}")
+        self.logger.info(f"  - Channels: {self.config.channels}")
+
+    def _analyze_block(self, samples):
+        """Analyze one block of int16 samples for voice-band energy.
+
+        Vectorized end to end: FFT and band sum run in numpy/scipy, the
+        per-frame baseline update in the (optionally JIT-ed) detector.
+        Returns True while an anomaly is in progress.
+        """
+        sample_rate = self.config.sample_rate
+        spectrum = np.abs(_rfft(samples.astype(np.float32)))
+        n = len(samples)
+        lo = int(self.VOICE_BAND_HZ[0] * n / sample_rate)
+        hi = int(self.VOICE_BAND_HZ[1] * n / sample_rate)
+        band_energy = float(spectrum[lo:hi].sum())
+
+        if self._baseline == 0.0:
+            self._baseline = band_energy  # seed from the first block
+
+        self._baseline, self._in_event = _detect_anomaly(
+            band_energy, self._baseline,
+            self.config.threshold_ratio, self._in_event)
+        return self._in_event
+
     async def start_detection(self):
         """Start EVP detection loop."""
-        if not self.config.get('enabled'):
+        if not self.config.enabled:
             return
-            
+
         self.recording = True
-        while running and self.recording:
-            # Placeholder for audio analysis
-            await asyncio.sleep(0.1)
+
+        try:
+            import sounddevice as sd
+        except ImportError:
+            self.logger.warning("sounddevice not available, EVP detection idle")
+            while running and self.recording:
+                await asyncio.sleep(0.1)
+            return
+
+        loop = asyncio.get_running_loop()
+        blocks = asyncio.Queue(maxsize=64)
+
+        def on_block(indata, frames, time_info, status):
+            # Runs on the PortAudio thread; hand the block to the loop.
+            try:
+                loop.call_soon_threadsafe(blocks.put_nowait, indata.copy())
+            except RuntimeError:
+                pass  # loop already closed during shutdown
+
+        stream = sd.InputStream(
+            samplerate=self.config.sample_rate,
+            channels=self.config.channels,
+            dtype='int16',
+            blocksize=1024,
+            callback=on_block)
+
+        with stream:
+            while running and self.recording:
+                try:
+                    block = await asyncio.wait_for(blocks.get(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                if self._analyze_block(block[:, 0]):
+                    self.logger.info("EVP anomaly detected")
 
 
 class CameraManager:
     """Camera system with night vision and motion detection."""
     
     def __init__(self, config):
-        self.config = config.get('camera', {})
+        self.config = config.camera
         self.logger = logging.getLogger('camera')
         self.streaming = False
         
     async def initialize(self):
         """Initialize camera system."""
-        if not self.config.get('enabled'):
+        if not self.config.enabled:
             self.logger.info("Camera disabled")
             return
-            
+
         self.logger.info("Initializing camera...")
-        self.logger.info(f"  - Device: {self.config.get('device', '/dev/video0')}")
-        self.logger.info(f"  - Resolution: {self.config.get('resolution', '1280x720')}")
-        self.logger.info(f"  - Night vision: {self.config.get('night_vision', False)}")
+        self.logger.info(f"  - Device: {self.config.device}")
+        self.logger.info(f"  - Resolution: {self.config.resolution}")
+        self.logger.info(f"  - Night vision: {self.config.night_vision}")
         
     async def start_stream(self):
         """Start video stream."""
-        if not self.config.get('enabled'):
+        if not self.config.enabled:
             return
-            
-        self.streaming = True
-        while running and self.streaming:
-            # Placeholder for frame capture
-            await asyncio.sleep(1/30)  # 30 FPS
 
+        self.streaming = True
+        device = self.config.device
 
-class WebDashboard:
-    """Web-based control and monitoring dashboard."""
-    
-    def __init__(self, config, sensors, evp, camera):
-        self.config = config.get('web', {})
-        self.sensors = sensors
-        self.evp = evp
-        self.camera = camera
-        self.logger = logging.getLogger('web')
-        self.app = None
-        
-    async def initialize(self):
-        """Initialize web server."""
-        if not self.config.get('enabled', True):
-            self.logger.info("Web dashboard disabled")
+        # Let the kernel pace the stream: register the device fd with
+        # the event loop so _on_frame_ready fires exactly when a frame
+        # is available, instead of approximating the cadence with
+        # sleep(1/30) and drifting. Falls back to the timed loop when
+        # the device cannot be opened (mock mode on a dev machine).
+        try:
+            fd = os.open(device, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError as e:
+            self.logger.warning(f"Cannot open {device} ({e}), using timed capture loop")
+            while running and self.streaming:
+                await asyncio.sleep(1/30)  # 30 FPS
             return
-            
-        self.logger.info("Initializing web dashboard...")
-        self.logger.info(f"  - Host: {self.config.get('host', '0.0.0.0')}")
-        self.logger.info(f"  - Port: {self.config.get('port', 8765)}")
-        
+
+        loop = asyncio.get_running_loop()
+        loop.add_reader(fd, self._on_frame_ready, fd)
         try:
-            from flask import Flask, jsonify, render_template_string
-            from flask_cors import CORS
-            
-            self.app = Flask(__name__)
-            CORS(self.app)
-            
-            @self.app.route('/')
-            def index():
-                return render_template_string(self._get_dashboard_html())
-                
-            @self.app.route('/api/status')
-            def status():
-                return jsonify({
-                    'status': 'running',
-                    'version': __version__,
-                    'timestamp': datetime.now().isoformat()
-                })
-                
-            @self.app.route('/api/sensors')
-            async def sensors():
-                readings = await self.sensors.read_all()
-                return jsonify(readings)
-                
-            self.logger.info("Web dashboard initialized")
-            
-        except ImportError as e:
-            self.logger.error(f"Failed to initialize web dashboard: {e}")
-            
-    def _get_dashboard_html(self):
-        """Return the dashboard HTML template."""
-        return """
+            while running and self.streaming:
+                await asyncio.sleep(1)  # frame work happens in the fd callback
+        finally:
+            loop.remove_reader(fd)
+            os.close(fd)
+
+    def _on_frame_ready(self, fd):
+        """Drain one frame from the device; invoked by the event loop."""
+        try:
+            frame = os.read(fd, 1 << 20)
+        except (BlockingIOError, OSError):
+            return
+        # Placeholder: hand the frame to motion detection / recording
+        self._last_frame_size = len(frame)
+
+
+# The dashboard page is fully static: encode it once at import time and
+# keep a pre-compressed copy for clients that accept gzip, so serving /
+# never touches a template engine or deflates per request.
+DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -420,26 +597,96 @@ class WebDashboard:
 </body>
 </html>
         """
-        
+_DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode('utf-8')
+_DASHBOARD_HTML_GZ = gzip.compress(_DASHBOARD_HTML_BYTES, 9)
+
+
+class WebDashboard:
+    """Web-based control and monitoring dashboard."""
+    
+    def __init__(self, config, sensors, evp, camera):
+        self.config = config.web
+        self.sensors = sensors
+        self.evp = evp
+        self.camera = camera
+        self.logger = logging.getLogger('web')
+        self.app = None
+        self.runner = None
+        self._web = None
+
+    async def initialize(self):
+        """Initialize web server."""
+        if not self.config.enabled:
+            self.logger.info("Web dashboard disabled")
+            return
+
+        self.logger.info("Initializing web dashboard...")
+        self.logger.info(f"  - Host: {self.config.host}")
+        self.logger.info(f"  - Port: {self.config.port}")
+
+        try:
+            from aiohttp import web
+        except ImportError as e:
+            self.logger.error(f"Failed to initialize web dashboard: {e}")
+            return
+
+        self._web = web
+        self.app = web.Application()
+
+        async def index(request):
+            if 'gzip' in request.headers.get('Accept-Encoding', ''):
+                return web.Response(body=_DASHBOARD_HTML_GZ,
+                                    content_type='text/html',
+                                    headers={'Content-Encoding': 'gzip'})
+            return web.Response(body=_DASHBOARD_HTML_BYTES,
+                                content_type='text/html')
+
+        async def status(request):
+            return web.Response(body=_json_bytes({
+                'status': 'running',
+                'version': __version__,
+                'timestamp': datetime.now().isoformat()
+            }), content_type='application/json')
+
+        async def sensors(request):
+            # Real coroutine on the main loop - sensor reads happen
+            # without any thread handoff.
+            readings = await self.sensors.read_all()
+            return web.Response(body=_json_bytes(readings),
+                                content_type='application/json')
+
+        self.app.router.add_get('/', index)
+        self.app.router.add_get('/api/status', status)
+        self.app.router.add_get('/api/sensors', sensors)
+
+        # Allow cross-origin polling (replaces flask-cors).
+        async def add_cors_headers(request, response):
+            response.headers['Access-Control-Allow-Origin'] = '*'
+
+        self.app.on_response_prepare.append(add_cors_headers)
+
+        self.logger.info("Web dashboard initialized")
+            
     async def run(self):
-        """Run the web server."""
+        """Start the web server on the running event loop."""
         if not self.app:
             return
-            
-        # Use asyncio-compatible server
-        from werkzeug.serving import make_server
-        
-        host = self.config.get('host', '0.0.0.0')
-        port = self.config.get('port', 8765)
-        
-        server = make_server(host, port, self.app, threaded=True)
+
+        host = self.config.host
+        port = self.config.port
+
+        # Serve on the main event loop - no background thread, no
+        # thread-per-request.
+        self.runner = self._web.AppRunner(self.app)
+        await self.runner.setup()
+        site = self._web.TCPSite(self.runner, host, port)
+        await site.start()
         self.logger.info(f"Web dashboard running at http://{host}:{port}")
-        
-        # Run in background
-        import threading
-        thread = threading.Thread(target=server.serve_forever)
-        thread.daemon = True
-        thread.start()
+
+    async def shutdown(self):
+        """Stop the web server."""
+        if self.runner:
+            await self.runner.cleanup()
 
 
 async def main():
@@ -481,7 +728,7 @@ async def main():
     await web_dashboard.run()
     
     logger.info("All systems operational")
-    logger.info(f"Web dashboard: http://0.0.0.0:{config.get('web', {}).get('port', 8765)}")
+    logger.info(f"Web dashboard: http://0.0.0.0:{config.web.port}")
     
     # Wait for shutdown
     while running:
@@ -491,7 +738,8 @@ async def main():
     logger.info("Shutting down...")
     for task in tasks:
         task.cancel()
-    
+    await web_dashboard.shutdown()
+
     logger.info("GlowBarn OS shutdown complete")
 
 
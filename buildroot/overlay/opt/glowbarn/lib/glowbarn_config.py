@@ -0,0 +1,220 @@
+"""
+Shared configuration helpers for GlowBarn OS.
+
+Used by both glowbarn.py and glowbarn-cli.py via the /opt/glowbarn/lib
+path. Parsed configs are cached keyed on (mtime, size) so repeated calls
+only pay for an os.stat() when the file has not changed — YAML parsing
+is expensive relative to a stat, and CLI subcommands reload the config
+on every invocation.
+"""
+
+import copy
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, is_dataclass, replace
+from functools import lru_cache
+from pathlib import Path
+
+CONFIG_PATH = Path("/etc/glowbarn/config.yaml")
+
+# PyYAML is imported on first parse, not at module import: CLI
+# subcommands that never touch a config file (status, logs, service)
+# shouldn't pay its import cost. Resolved lazily by _yaml().
+_YAML = None
+SafeLoader = None
+SafeDumper = None
+
+
+def _yaml():
+    """Import PyYAML on first use and select the LibYAML classes.
+
+    CSafeLoader/CSafeDumper are typically 5-10x faster than the
+    pure-Python implementations; fall back for builds without libyaml.
+    """
+    global _YAML, SafeLoader, SafeDumper
+    if _YAML is None:
+        import yaml
+        try:
+            SafeLoader = yaml.CSafeLoader
+            SafeDumper = yaml.CSafeDumper
+        except AttributeError:
+            SafeLoader = yaml.SafeLoader
+            SafeDumper = yaml.SafeDumper
+        _YAML = yaml
+    return _YAML
+
+
+def safe_dump(data, **kwargs):
+    """yaml.dump with the fastest available safe dumper."""
+    return _yaml().dump(data, Dumper=SafeDumper, **kwargs)
+
+# Parsed configs keyed by path; each entry is (mtime, size, parsed dict).
+# LRU order maintained with move_to_end/popitem.
+_CONFIG_CACHE = OrderedDict()
+_CACHE_MAX_ENTRIES = 100
+
+
+def load_config(path=CONFIG_PATH):
+    """Load a YAML config file, reusing the cached parse when unchanged.
+
+    Returns the parsed dict, or None if the file does not exist. Callers
+    always get a deep copy so mutating the result cannot corrupt the
+    cached copy.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    key = str(path)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _CONFIG_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    yaml = _yaml()
+    with open(path, 'r') as f:
+        parsed = yaml.load(f, Loader=SafeLoader)
+
+    _CONFIG_CACHE[key] = (st.st_mtime, st.st_size, parsed)
+    _CONFIG_CACHE.move_to_end(key)
+    while len(_CONFIG_CACHE) > _CACHE_MAX_ENTRIES:
+        _CONFIG_CACHE.popitem(last=False)
+
+    return copy.deepcopy(parsed)
+
+
+# Structured config schema. Frozen + slots keeps instances small and
+# makes every access a plain attribute load instead of the
+# .get('section', {}).get('key', default) double dict lookup (and the
+# throwaway default dict it allocates) that the raw parse forces on
+# every caller.
+
+@dataclass(frozen=True, slots=True)
+class WebConfig:
+    enabled: bool = True
+    host: str = '0.0.0.0'
+    port: int = 8765
+
+
+@dataclass(frozen=True, slots=True)
+class SensorConfig:
+    enabled: bool = False
+    pin: int = 0
+    type: str = ''
+    sample_rate: int = 100
+    i2c_address: int = 0x76
+    path: str = ''  # optional sysfs file backing this sensor
+
+
+@dataclass(frozen=True, slots=True)
+class SensorsConfig:
+    emf: SensorConfig = field(default_factory=lambda: SensorConfig(pin=17))
+    temperature: SensorConfig = field(
+        default_factory=lambda: SensorConfig(pin=4, type='ds18b20'))
+    humidity: SensorConfig = field(
+        default_factory=lambda: SensorConfig(pin=22, type='dht22'))
+    motion: SensorConfig = field(default_factory=lambda: SensorConfig(pin=27))
+    vibration: SensorConfig = field(default_factory=lambda: SensorConfig(pin=23))
+    pressure: SensorConfig = field(
+        default_factory=lambda: SensorConfig(type='bmp280'))
+
+
+@dataclass(frozen=True, slots=True)
+class EVPConfig:
+    enabled: bool = False
+    sample_rate: int = 44100
+    channels: int = 2
+    threshold_ratio: float = 4.0
+
+
+@dataclass(frozen=True, slots=True)
+class AudioConfig:
+    evp_detection: EVPConfig = field(default_factory=EVPConfig)
+
+
+@dataclass(frozen=True, slots=True)
+class CameraConfig:
+    enabled: bool = False
+    device: str = '/dev/video0'
+    resolution: str = '1280x720'
+    night_vision: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingConfig:
+    level: str = 'INFO'
+    file: str = ''
+
+
+@dataclass(frozen=True, slots=True)
+class AlertsConfig:
+    enabled: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class GlowbarnConfig:
+    web: WebConfig = field(default_factory=WebConfig)
+    sensors: SensorsConfig = field(default_factory=SensorsConfig)
+    audio: AudioConfig = field(default_factory=AudioConfig)
+    camera: CameraConfig = field(default_factory=CameraConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    alerts: AlertsConfig = field(default_factory=AlertsConfig)
+
+
+def _merge(obj, data):
+    """Overlay a parsed config dict onto a dataclass instance."""
+    if not data:
+        return obj
+    updates = {}
+    for f in fields(obj):
+        if f.name in data:
+            current = getattr(obj, f.name)
+            if is_dataclass(current):
+                updates[f.name] = _merge(current, data[f.name] or {})
+            else:
+                updates[f.name] = data[f.name]
+    return replace(obj, **updates) if updates else obj
+
+
+def load_structured(path=CONFIG_PATH):
+    """Load the config file into a frozen GlowbarnConfig.
+
+    Unknown keys are ignored; missing ones keep the schema defaults, so
+    callers never need per-access fallbacks. Built on the cached
+    load_config(), so an unchanged file costs a stat plus the merge.
+    """
+    return _merge(GlowbarnConfig(), load_config(path) or {})
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _resolve(stat_key, path_str, key):
+    """Walk a dotted key through the config identified by stat_key."""
+    value = load_config(Path(path_str)) or {}
+    for part in key.split('.'):
+        if not isinstance(value, dict):
+            return _MISSING
+        value = value.get(part, _MISSING)
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+
+def get_key(key, path=CONFIG_PATH, default=None):
+    """Resolve a dotted config key like 'web.port'.
+
+    Lookups are memoized on (mtime, size, key), so repeated gets against
+    an unchanged config skip both the YAML parse and the dict walk. The
+    cache invalidates itself because the stat tuple is part of the key.
+    """
+    try:
+        st = os.stat(path)
+        stat_key = (st.st_mtime, st.st_size)
+    except OSError:
+        return default
+
+    value = _resolve(stat_key, str(path), key)
+    return default if value is _MISSING else value
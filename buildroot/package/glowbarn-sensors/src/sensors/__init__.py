@@ -10,6 +10,7 @@ from .humidity import HumiditySensor
 from .motion import MotionSensor
 from .vibration import VibrationSensor
 from .pressure import PressureSensor
+from .batch import read_cycle, poll_all
 
 __all__ = [
     'SensorBase',
@@ -20,6 +21,8 @@ __all__ = [
     'MotionSensor',
     'VibrationSensor',
     'PressureSensor',
+    'read_cycle',
+    'poll_all',
 ]
 
 __version__ = "1.0.0"
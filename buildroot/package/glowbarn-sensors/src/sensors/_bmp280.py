@@ -0,0 +1,45 @@
+"""
+BMP280/BME280 compensation kernel for GlowBarn OS.
+
+The Bosch datasheet float compensation, isolated as a plain function of
+scalars so numba can JIT it when available. At high poll rates the
+interpreter cost of the ~30 arithmetic ops dominates the math itself;
+the jitted kernel removes that. Without numba the pure-Python version
+runs unchanged, so nothing here is a hard dependency.
+"""
+
+
+def compensate(adc_t, adc_p, dig_t1, dig_t2, dig_t3, dig_p1, dig_p2,
+               dig_p3, dig_p4, dig_p5, dig_p6, dig_p7, dig_p8, dig_p9):
+    """Convert raw ADC words to (temperature degC, pressure Pa).
+
+    Straight from the BMP280 datasheet's floating-point compensation;
+    dig_* are the factory calibration constants read from 0x88.
+    """
+    var1 = (adc_t / 16384.0 - dig_t1 / 1024.0) * dig_t2
+    var2 = ((adc_t / 131072.0 - dig_t1 / 8192.0) ** 2) * dig_t3
+    t_fine = var1 + var2
+    temp_c = t_fine / 5120.0
+
+    var1 = t_fine / 2.0 - 64000.0
+    var2 = var1 * var1 * dig_p6 / 32768.0
+    var2 = var2 + var1 * dig_p5 * 2.0
+    var2 = var2 / 4.0 + dig_p4 * 65536.0
+    var1 = (dig_p3 * var1 * var1 / 524288.0 + dig_p2 * var1) / 524288.0
+    var1 = (1.0 + var1 / 32768.0) * dig_p1
+    if var1 == 0:
+        return temp_c, 0.0
+
+    p = 1048576.0 - adc_p
+    p = (p - var2 / 4096.0) * 6250.0 / var1
+    var1 = dig_p9 * p * p / 2147483648.0
+    var2 = p * dig_p8 / 32768.0
+    p = p + (var1 + var2 + dig_p7) / 16.0
+    return temp_c, p
+
+
+try:
+    from numba import njit
+    compensate = njit(cache=True)(compensate)
+except ImportError:
+    pass
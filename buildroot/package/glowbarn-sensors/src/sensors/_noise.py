@@ -0,0 +1,55 @@
+"""
+Shared noise source for simulated sensor readings.
+
+Pre-samples large batches of random numbers with numpy's generator into
+circular buffers shared by every sensor's polling loop, amortizing the
+RNG cost across all draws; calling random.gauss/random.random per
+sample pays Mersenne Twister plus Python call overhead on every hot
+read(). Falls back to the stdlib random module when numpy is
+unavailable.
+"""
+
+_BUF_SIZE = 4096
+
+try:
+    import numpy as np
+
+    _rng = np.random.default_rng()
+    _gauss_buf = _rng.standard_normal(_BUF_SIZE)
+    _uni_buf = _rng.random(_BUF_SIZE)
+    _gauss_idx = 0
+    _uni_idx = 0
+
+    def next_gauss(mu: float = 0.0, sigma: float = 1.0) -> float:
+        """Return the next pre-sampled Gaussian, scaled to (mu, sigma)."""
+        global _gauss_idx
+        if _gauss_idx >= _BUF_SIZE:
+            # Refill in place, no fresh allocation
+            _rng.standard_normal(out=_gauss_buf)
+            _gauss_idx = 0
+        value = _gauss_buf[_gauss_idx]
+        _gauss_idx += 1
+        return mu + sigma * float(value)
+
+    def next_uniform(low: float = 0.0, high: float = 1.0) -> float:
+        """Return the next pre-sampled uniform draw in [low, high)."""
+        global _uni_idx
+        if _uni_idx >= _BUF_SIZE:
+            _rng.random(out=_uni_buf)
+            _uni_idx = 0
+        value = _uni_buf[_uni_idx]
+        _uni_idx += 1
+        return low + (high - low) * float(value)
+
+except ImportError:
+    # Pre-bound locally so each draw skips the random-module attribute
+    # lookup in the hot read() paths
+    from random import gauss as _gauss, uniform as _uniform
+
+    def next_gauss(mu: float = 0.0, sigma: float = 1.0) -> float:
+        """Stdlib fallback for next_gauss."""
+        return _gauss(mu, sigma)
+
+    def next_uniform(low: float = 0.0, high: float = 1.0) -> float:
+        """Stdlib fallback for next_uniform."""
+        return _uniform(low, high)
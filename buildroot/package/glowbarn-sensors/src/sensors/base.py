@@ -3,23 +3,51 @@ Base classes for GlowBarn sensors.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any, Dict, Optional
+import asyncio
 import logging
+import time
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
 
-@dataclass
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def fixed_round(value: float, scale: float) -> float:
+    """Round value to 1/scale precision via scaled-integer arithmetic.
+
+    Equivalent to round(value, ndigits) with scale = 10**ndigits for the
+    magnitudes sensors produce, but skips built-in round's ndigits
+    machinery — it is just a multiply, an int truncation and a divide,
+    which is markedly cheaper on the per-read path.
+    """
+    if value >= 0:
+        return int(value * scale + 0.5) / scale
+    return -int(-value * scale + 0.5) / scale
+
+
+# slots=True drops the per-instance __dict__ (a real saving at 10 Hz
+# across six sensors) and makes attribute access a slot load; frozen=True
+# is safe because readings are never mutated after _create_reading.
+@dataclass(slots=True, frozen=True)
 class SensorReading:
     """Represents a single sensor reading."""
     sensor_id: str
     sensor_type: str
     value: Any
     unit: str
-    timestamp: datetime
+    timestamp: int  # ns since epoch; formatting deferred to to_dict
     quality: float = 1.0  # 0.0 to 1.0, indicates reading reliability
     metadata: Optional[Dict[str, Any]] = None
-    
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert reading to dictionary."""
         return {
@@ -27,22 +55,74 @@ class SensorReading:
             'sensor_type': self.sensor_type,
             'value': self.value,
             'unit': self.unit,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': datetime.fromtimestamp(self.timestamp / 1e9).isoformat(),
             'quality': self.quality,
             'metadata': self.metadata or {}
         }
 
+    def to_json_bytes(self, prefix: bytes) -> bytes:
+        """Serialize to JSON bytes using a pre-built per-sensor prefix.
+
+        sensor_id, sensor_type and unit never change for a given sensor,
+        so their share of the document is encoded once into the prefix
+        (see SensorBase._json_prefix) and only the variable fields are
+        serialized per reading. Produces the same schema as to_dict.
+        """
+        return b''.join((
+            prefix,
+            _json_dumps(self.value),
+            b',"timestamp":',
+            _json_dumps(
+                datetime.fromtimestamp(self.timestamp / 1e9).isoformat()),
+            b',"quality":',
+            _json_dumps(self.quality),
+            b',"metadata":',
+            _json_dumps(self.metadata or {}),
+            b'}',
+        ))
+
 
 class SensorBase(ABC):
     """Abstract base class for all sensors."""
-    
+
+    # Slow-drifting sensors (humidity, pressure, temperature) set this
+    # True: consecutive reads with an unchanged value reuse the previous
+    # SensorReading with a fresh timestamp instead of allocating a new
+    # reading and metadata dict. Event sensors (motion, vibration) must
+    # leave it off — every edge matters there.
+    _reuse_unchanged = False
+
     def __init__(self, sensor_id: str, config: Dict[str, Any] = None):
         self.sensor_id = sensor_id
         self.config = config or {}
         self.logger = logging.getLogger(f'sensor.{sensor_id}')
         self._initialized = False
         self._last_reading: Optional[SensorReading] = None
-        
+        # Minimum seconds between reads; 0 (the default) disables gating
+        # so existing pollers keep their own pacing. Set min_interval_s
+        # in the sensor config for "1 Hz class" hardware that shouldn't
+        # be busy-read.
+        self._min_interval = float(self.config.get('min_interval_s', 0.0))
+        self._next_allowed = 0.0
+        # sensor_type/unit are constant per instance but cost a property
+        # dispatch per access; cached lazily on first _create_reading
+        # because subclasses may set the attributes the properties read
+        # (e.g. TemperatureSensor.unit_format) after this __init__ runs.
+        self._type_cache: Optional[str] = None
+        self._unit_cache: Optional[str] = None
+        self._json_prefix: Optional[bytes] = None
+
+    def set_phase_offset(self, offset: float) -> None:
+        """Delay this sensor's first gated read by offset seconds.
+
+        Staggering the phases of sensors that share a bus (I2C in
+        particular) keeps them from all transacting at the same instant
+        and serializing on the bus. Only affects sensors with a
+        min_interval_s configured; the batch poller assigns offsets.
+        """
+        if self._min_interval > 0.0:
+            self._next_allowed = time.monotonic() + offset
+
     @property
     @abstractmethod
     def sensor_type(self) -> str:
@@ -64,17 +144,38 @@ class SensorBase(ABC):
         pass
     
     @abstractmethod
-    async def read(self) -> SensorReading:
+    async def _read_impl(self, timestamp: Optional[int] = None) -> SensorReading:
         """
         Take a reading from the sensor.
         Returns a SensorReading object.
+
+        Subclasses implement this; callers go through read(), which
+        enforces the sensor's minimum poll interval.
         """
         pass
+
+    async def read(self, timestamp: Optional[int] = None) -> SensorReading:
+        """
+        Take a reading, honouring the sensor's minimum poll interval.
+
+        If min_interval_s is configured and the previous read was too
+        recent, sleep until the interval has elapsed before sampling.
+        A batch poller may pass the cycle's shared timestamp so all
+        readings in one gather carry the same stamp.
+        """
+        if self._min_interval > 0.0:
+            now = time.monotonic()
+            if now < self._next_allowed:
+                await asyncio.sleep(self._next_allowed - now)
+            reading = await self._read_impl(timestamp)
+            self._next_allowed = time.monotonic() + self._min_interval
+            return reading
+        return await self._read_impl(timestamp)
     
     async def shutdown(self) -> None:
         """Clean up sensor resources."""
         self._initialized = False
-        self.logger.info(f"Sensor {self.sensor_id} shutdown")
+        self.logger.info("Sensor %s shutdown", self.sensor_id)
     
     @property
     def is_initialized(self) -> bool:
@@ -86,15 +187,45 @@ class SensorBase(ABC):
         """Get the last reading taken."""
         return self._last_reading
     
-    def _create_reading(self, value: Any, quality: float = 1.0, 
-                       metadata: Dict[str, Any] = None) -> SensorReading:
+    def _invalidate_reading_cache(self) -> None:
+        """Drop cached sensor_type/unit after a change that affects them."""
+        self._type_cache = None
+        self._unit_cache = None
+        self._json_prefix = None
+
+    def serialize(self, reading: SensorReading) -> bytes:
+        """JSON-encode a reading with this sensor's pre-built prefix."""
+        if self._json_prefix is None:
+            prefix = '{"sensor_id":%s,"sensor_type":%s,"unit":%s,"value":' % (
+                _json_dumps(self.sensor_id).decode(),
+                _json_dumps(self.sensor_type).decode(),
+                _json_dumps(self.unit).decode())
+            self._json_prefix = prefix.encode()
+        return reading.to_json_bytes(self._json_prefix)
+
+    def _create_reading(self, value: Any, quality: float = 1.0,
+                       metadata: Dict[str, Any] = None,
+                       timestamp: Optional[int] = None) -> SensorReading:
         """Helper to create a sensor reading."""
+        last = self._last_reading
+        if (self._reuse_unchanged and last is not None
+                and last.value == value and last.quality == quality):
+            reading = replace(
+                last,
+                timestamp=timestamp if timestamp is not None else time.time_ns())
+            self._last_reading = reading
+            return reading
+        if self._type_cache is None:
+            self._type_cache = self.sensor_type
+            self._unit_cache = self.unit
         reading = SensorReading(
             sensor_id=self.sensor_id,
-            sensor_type=self.sensor_type,
+            sensor_type=self._type_cache,
             value=value,
-            unit=self.unit,
-            timestamp=datetime.now(),
+            unit=self._unit_cache,
+            # An int clock read is a fraction of building a datetime;
+            # the ISO string only gets made if the reading is serialized
+            timestamp=timestamp if timestamp is not None else time.time_ns(),
             quality=quality,
             metadata=metadata
         )
@@ -102,65 +233,95 @@ class SensorBase(ABC):
         return reading
 
 
+# All GPIO sensors sit on gpiochip0; sharing one chip handle avoids an
+# open file descriptor per sensor. The handle stays open for the process
+# lifetime and is closed by the atexit hook, not by sensor shutdown.
+_GPIO_CHIP = None
+
+
+def _get_chip():
+    """Get (or lazily open) the shared gpiod chip handle."""
+    global _GPIO_CHIP
+    if _GPIO_CHIP is None:
+        import atexit
+        import gpiod
+        _GPIO_CHIP = gpiod.Chip('gpiochip0')
+        atexit.register(_GPIO_CHIP.close)
+    return _GPIO_CHIP
+
+
 class GPIOSensor(SensorBase):
     """Base class for GPIO-based sensors."""
-    
+
     def __init__(self, sensor_id: str, pin: int, config: Dict[str, Any] = None):
         super().__init__(sensor_id, config)
         self.pin = pin
-        self._chip = None
         self._line = None
-    
+
     async def initialize(self) -> bool:
         """Initialize GPIO access."""
         try:
-            import gpiod
-            self._chip = gpiod.Chip('gpiochip0')
-            self._line = self._chip.get_line(self.pin)
+            self._line = _get_chip().get_line(self.pin)
             self._initialized = True
-            self.logger.info(f"GPIO sensor initialized on pin {self.pin}")
+            self.logger.info("GPIO sensor initialized on pin %s", self.pin)
             return True
         except ImportError:
             self.logger.warning("gpiod not available, using mock mode")
             self._initialized = True
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize GPIO: {e}")
+            self.logger.error("Failed to initialize GPIO: %s", e)
             return False
-    
+
     async def shutdown(self) -> None:
         """Release GPIO resources."""
         if self._line:
             self._line.release()
-        if self._chip:
-            self._chip.close()
         await super().shutdown()
 
 
+# One single-thread executor per I2C bus: smbus2 handles are not
+# thread-safe, so every transaction for a bus funnels through its own
+# worker while the event loop stays free during the bus wait.
+_BUS_EXECUTORS: Dict[int, ThreadPoolExecutor] = {}
+
+
+def _bus_executor(bus: int) -> ThreadPoolExecutor:
+    """Get (or create) the dedicated executor for an I2C bus."""
+    executor = _BUS_EXECUTORS.get(bus)
+    if executor is None:
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f'i2c-bus{bus}')
+        _BUS_EXECUTORS[bus] = executor
+    return executor
+
+
 class I2CSensor(SensorBase):
     """Base class for I2C-based sensors."""
-    
-    def __init__(self, sensor_id: str, address: int, bus: int = 1, 
+
+    def __init__(self, sensor_id: str, address: int, bus: int = 1,
                  config: Dict[str, Any] = None):
         super().__init__(sensor_id, config)
         self.address = address
         self.bus = bus
         self._i2c = None
-    
+        self._executor = None
+
     async def initialize(self) -> bool:
         """Initialize I2C access."""
         try:
             import smbus2
             self._i2c = smbus2.SMBus(self.bus)
+            self._executor = _bus_executor(self.bus)
             self._initialized = True
-            self.logger.info(f"I2C sensor initialized at address 0x{self.address:02X}")
+            self.logger.info("I2C sensor initialized at address 0x%02X", self.address)
             return True
         except ImportError:
             self.logger.warning("smbus2 not available, using mock mode")
             self._initialized = True
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize I2C: {e}")
+            self.logger.error("Failed to initialize I2C: %s", e)
             return False
     
     async def shutdown(self) -> None:
@@ -180,6 +341,47 @@ class I2CSensor(SensorBase):
         if self._i2c:
             self._i2c.write_byte_data(self.address, register, value)
 
+    def read_block(self, register: int, length: int) -> list:
+        """Read a run of registers in a single bus transaction.
+
+        Each I2C byte read pays a full address+register handshake, so
+        fetching N contiguous registers as one block is ~N times fewer
+        bus turnarounds than N read_byte calls.
+        """
+        if self._i2c:
+            return self._i2c.read_i2c_block_data(self.address, register, length)
+        return [0] * length
+
+    async def aio_read_block(self, register: int, length: int) -> list:
+        """Block read without blocking the event loop."""
+        if not self._i2c:
+            return [0] * length
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._i2c.read_i2c_block_data,
+            self.address, register, length)
+
+    async def aio_read_byte(self, register: int) -> int:
+        """Read a register byte without blocking the event loop.
+
+        The transaction runs on the bus's dedicated executor thread, so
+        other sensor coroutines progress during the I2C wait.
+        """
+        if not self._i2c:
+            return 0
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._i2c.read_byte_data, self.address, register)
+
+    async def aio_write_byte(self, register: int, value: int) -> None:
+        """Write a register byte without blocking the event loop."""
+        if not self._i2c:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._executor, self._i2c.write_byte_data,
+            self.address, register, value)
+
 
 class SerialSensor(SensorBase):
     """Base class for serial/USB sensors."""
@@ -197,14 +399,14 @@ class SerialSensor(SensorBase):
             import serial
             self._serial = serial.Serial(self.port, self.baudrate, timeout=1)
             self._initialized = True
-            self.logger.info(f"Serial sensor initialized on {self.port}")
+            self.logger.info("Serial sensor initialized on %s", self.port)
             return True
         except ImportError:
             self.logger.warning("pyserial not available, using mock mode")
             self._initialized = True
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize serial: {e}")
+            self.logger.error("Failed to initialize serial: %s", e)
             return False
     
     async def shutdown(self) -> None:
@@ -212,3 +414,17 @@ class SerialSensor(SensorBase):
         if self._serial and self._serial.is_open:
             self._serial.close()
         await super().shutdown()
+
+    def read_batch(self, max_bytes: int = 64) -> bytes:
+        """Drain up to max_bytes of buffered serial input in one call.
+
+        Subclass read() implementations should call this and parse
+        frames out of the returned buffer rather than looping over
+        read(1): each read() is a syscall into the UART driver, so
+        draining in_waiting bytes at once collapses per-byte overhead
+        into one call per poll. When nothing is buffered, this blocks
+        for at most one byte (bounded by the port timeout).
+        """
+        if not self._serial:
+            return b''
+        return self._serial.read(min(max_bytes, self._serial.in_waiting or 1))
@@ -0,0 +1,46 @@
+"""
+Batched sensor polling for GlowBarn OS.
+
+Reading sensors one after another makes a poll cycle take the sum of
+the individual latencies; gathering them concurrently makes it take
+only the slowest one, since I2C/serial/GPIO waits overlap. Every
+reading in a cycle carries the same timestamp, taken once up front.
+"""
+
+from typing import Callable, List, Optional, Sequence
+import asyncio
+import time
+
+from .base import SensorBase, SensorReading
+
+
+async def read_cycle(sensors: Sequence[SensorBase],
+                     timestamp: Optional[int] = None) -> List[SensorReading]:
+    """Read every sensor concurrently and return the readings in order.
+
+    All readings share one timestamp (ns since epoch), so downstream
+    consumers can treat the cycle as a single sample of the whole rig.
+    """
+    if timestamp is None:
+        timestamp = time.time_ns()
+    return list(await asyncio.gather(
+        *(sensor.read(timestamp=timestamp) for sensor in sensors)))
+
+
+async def poll_all(sensors: Sequence[SensorBase], period: float = 1.0,
+                   on_readings: Optional[Callable[[List[SensorReading]], None]] = None) -> None:
+    """Poll all sensors forever at a fixed period.
+
+    The sleep is computed from the cycle start, so the loop holds the
+    requested rate instead of drifting by each cycle's duration.
+    Interval-gated sensors get evenly spread phase offsets up front so
+    they don't all hit a shared bus at the same instant.
+    """
+    for i, sensor in enumerate(sensors):
+        sensor.set_phase_offset(i * period / len(sensors))
+    while True:
+        t0 = time.time_ns()
+        readings = await read_cycle(sensors, timestamp=t0)
+        if on_readings is not None:
+            on_readings(readings)
+        await asyncio.sleep(max(0.0, period - (time.time_ns() - t0) / 1e9))
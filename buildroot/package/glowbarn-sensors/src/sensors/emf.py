@@ -3,9 +3,27 @@ EMF (Electromagnetic Field) Sensor for GlowBarn OS.
 Supports various EMF detector modules and USB meters.
 """
 
-import random
-from typing import Any, Dict
-from .base import SensorBase, SensorReading, GPIOSensor
+from bisect import bisect_right
+from typing import Any, Dict, TypedDict
+import struct
+from ._noise import next_gauss, next_uniform
+from .base import SensorBase, SensorReading, GPIOSensor, fixed_round
+
+# Alert bands as a lookup table: bisect_right keeps the original ladder's
+# boundary behaviour (a value equal to a threshold lands in the band above)
+_ALERT_THRESHOLDS = (0.5, 2.0, 5.0)
+_ALERT_LEVELS = ("normal", "elevated", "high", "very_high")
+
+
+class EMFMeta(TypedDict):
+    """Metadata attached to every EMF reading (the _META_KEYS fields)."""
+    baseline: float
+    deviation: float
+    alert: bool
+
+
+# Fixed binary layout for streaming: value, baseline, deviation, alert
+_PACK = struct.Struct('<fff?')
 
 
 class EMFSensor(GPIOSensor):
@@ -18,6 +36,8 @@ class EMFSensor(GPIOSensor):
     - USB EMF meters via serial
     """
     
+    _META_KEYS = ('baseline', 'deviation', 'alert')
+
     @property
     def sensor_type(self) -> str:
         return "emf"
@@ -39,7 +59,7 @@ class EMFSensor(GPIOSensor):
         # In production, would take multiple readings to establish baseline
         return 0.3  # Typical ambient EMF
     
-    async def read(self) -> SensorReading:
+    async def _read_impl(self, timestamp: int = None) -> SensorReading:
         """
         Read current EMF level.
         
@@ -52,36 +72,40 @@ class EMFSensor(GPIOSensor):
         try:
             # In production, would read actual sensor value
             # Simulating realistic EMF readings with occasional spikes
-            base_reading = self._baseline + random.gauss(0, 0.1)
+            base_reading = self._baseline + next_gauss(0, 0.1)
             
             # Occasional spike simulation (for demo)
-            if random.random() < 0.02:  # 2% chance of spike
-                base_reading += random.uniform(1.0, 5.0)
+            if next_uniform() < 0.02:  # 2% chance of spike
+                base_reading += next_uniform(1.0, 5.0)
             
-            value = max(0.0, round(base_reading, 2))
+            value = max(0.0, fixed_round(base_reading, 100.0))
             
             # Determine quality based on reading stability
             quality = 1.0 if value < 10.0 else 0.8
             
-            metadata = {
-                'baseline': self._baseline,
-                'deviation': value - self._baseline,
-                'alert': value > 2.0
-            }
+            metadata = dict(zip(self._META_KEYS, (
+                self._baseline, value - self._baseline, value > 2.0)))
             
-            return self._create_reading(value, quality, metadata)
+            return self._create_reading(value, quality, metadata, timestamp)
             
         except Exception as e:
-            self.logger.error(f"EMF read error: {e}")
-            return self._create_reading(0.0, 0.0, {'error': str(e)})
+            self.logger.error("EMF read error: %s", e)
+            return self._create_reading(0.0, 0.0, {'error': str(e)}, timestamp)
     
     def get_alert_level(self, value: float) -> str:
         """Determine alert level based on EMF reading."""
-        if value < 0.5:
-            return "normal"
-        elif value < 2.0:
-            return "elevated"
-        elif value < 5.0:
-            return "high"
-        else:
-            return "very_high"
+        return _ALERT_LEVELS[bisect_right(_ALERT_THRESHOLDS, value)]
+
+    @staticmethod
+    def pack(reading: SensorReading) -> bytes:
+        """Pack a reading into the 13-byte wire format.
+
+        Streaming pipelines use this instead of JSON: a fixed
+        little-endian (value, baseline, deviation, alert) record is an
+        order of magnitude smaller than the to_dict document and needs
+        no parsing on the far side. Dashboards keep using to_dict.
+        """
+        meta: EMFMeta = reading.metadata or {}
+        return _PACK.pack(reading.value, meta.get('baseline', 0.0),
+                          meta.get('deviation', 0.0),
+                          bool(meta.get('alert', False)))
@@ -2,9 +2,14 @@
 Humidity Sensor for GlowBarn OS.
 """
 
-import random
+from bisect import bisect_right
 from typing import Any, Dict
-from .base import GPIOSensor, SensorReading
+from ._noise import next_gauss
+from .base import GPIOSensor, SensorReading, fixed_round
+
+# Comfort bands, table-driven like emf._ALERT_LEVELS
+_COMFORT_THRESHOLDS = (30, 50, 70)
+_COMFORT_LEVELS = ("dry", "comfortable", "humid", "very_humid")
 
 
 class HumiditySensor(GPIOSensor):
@@ -14,6 +19,10 @@ class HumiditySensor(GPIOSensor):
     Paranormal investigations often note humidity changes
     accompanying other phenomena.
     """
+
+    # Slow-drifting channel: reuse unchanged readings (see SensorBase)
+    _reuse_unchanged = True
+    _META_KEYS = ('model', 'comfort_level')
     
     def __init__(self, sensor_id: str, pin: int, sensor_model: str = "dht22",
                  config: Dict[str, Any] = None):
@@ -29,30 +38,21 @@ class HumiditySensor(GPIOSensor):
     def unit(self) -> str:
         return "%"
     
-    async def read(self) -> SensorReading:
+    async def _read_impl(self, timestamp: int = None) -> SensorReading:
         """Read current relative humidity."""
         try:
-            drift = random.gauss(0, 1.0)
+            drift = next_gauss(0, 1.0)
             self._last_humidity = max(10.0, min(95.0, self._last_humidity + drift))
-            value = round(self._last_humidity, 1)
+            value = fixed_round(self._last_humidity, 10.0)
             
-            metadata = {
-                'model': self.sensor_model,
-                'comfort_level': self._get_comfort_level(value)
-            }
+            metadata = dict(zip(self._META_KEYS, (
+                self.sensor_model, self._get_comfort_level(value))))
             
-            return self._create_reading(value, 1.0, metadata)
+            return self._create_reading(value, 1.0, metadata, timestamp)
             
         except Exception as e:
-            self.logger.error(f"Humidity read error: {e}")
-            return self._create_reading(0.0, 0.0, {'error': str(e)})
+            self.logger.error("Humidity read error: %s", e)
+            return self._create_reading(0.0, 0.0, {'error': str(e)}, timestamp)
     
     def _get_comfort_level(self, humidity: float) -> str:
-        if humidity < 30:
-            return "dry"
-        elif humidity < 50:
-            return "comfortable"
-        elif humidity < 70:
-            return "humid"
-        else:
-            return "very_humid"
+        return _COMFORT_LEVELS[bisect_right(_COMFORT_THRESHOLDS, humidity)]
@@ -3,8 +3,10 @@ Motion Sensor for GlowBarn OS.
 PIR-based motion detection for paranormal investigation.
 """
 
-import random
+from datetime import datetime
 from typing import Any, Dict
+import time
+from ._noise import next_uniform
 from .base import GPIOSensor, SensorReading
 
 
@@ -18,6 +20,8 @@ class MotionSensor(GPIOSensor):
     - Infrared anomalies
     """
     
+    _META_KEYS = ('total_events', 'last_motion')
+
     def __init__(self, sensor_id: str, pin: int, debounce_ms: int = 100,
                  config: Dict[str, Any] = None):
         super().__init__(sensor_id, pin, config)
@@ -33,24 +37,27 @@ class MotionSensor(GPIOSensor):
     def unit(self) -> str:
         return "bool"
     
-    async def read(self) -> SensorReading:
+    async def _read_impl(self, timestamp: int = None) -> SensorReading:
         """Read motion detection state."""
         try:
             # Simulate motion detection (1% chance)
-            detected = random.random() < 0.01
+            detected = next_uniform() < 0.01
             
             if detected:
                 self._motion_count += 1
-                from datetime import datetime
-                self._last_motion_time = datetime.now()
-            
-            metadata = {
-                'total_events': self._motion_count,
-                'last_motion': self._last_motion_time.isoformat() if self._last_motion_time else None
-            }
+                self._last_motion_time = time.time_ns()
+
+            if self._last_motion_time:
+                last_motion = datetime.fromtimestamp(
+                    self._last_motion_time / 1e9).isoformat()
+            else:
+                last_motion = None
+
+            metadata = dict(zip(self._META_KEYS, (
+                self._motion_count, last_motion)))
             
-            return self._create_reading(detected, 1.0, metadata)
+            return self._create_reading(detected, 1.0, metadata, timestamp)
             
         except Exception as e:
-            self.logger.error(f"Motion read error: {e}")
-            return self._create_reading(False, 0.0, {'error': str(e)})
+            self.logger.error("Motion read error: %s", e)
+            return self._create_reading(False, 0.0, {'error': str(e)}, timestamp)
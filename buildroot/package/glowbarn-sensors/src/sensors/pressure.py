@@ -3,9 +3,11 @@ Pressure Sensor for GlowBarn OS.
 Atmospheric pressure monitoring via I2C sensors.
 """
 
-import random
+import struct
 from typing import Any, Dict
-from .base import I2CSensor, SensorReading
+from ._bmp280 import compensate
+from ._noise import next_gauss
+from .base import I2CSensor, SensorReading, fixed_round
 
 
 class PressureSensor(I2CSensor):
@@ -17,11 +19,38 @@ class PressureSensor(I2CSensor):
     - Altitude variations
     - Anomalous atmospheric disturbances
     """
+
+    # Slow-drifting channel: reuse unchanged readings (see SensorBase)
+    _reuse_unchanged = True
+    _META_KEYS = ('altitude_approx_m', 'trend')
     
+    # BMP280/BME280 burst data register: press_msb..temp_xlsb, 6
+    # contiguous bytes covering both measurements
+    _REG_DATA = 0xF7
+
+    # Calibration registers dig_T1..dig_P9: 24 contiguous bytes
+    _REG_CALIB = 0x88
+
     def __init__(self, sensor_id: str, address: int = 0x76, bus: int = 1,
                  config: Dict[str, Any] = None):
         super().__init__(sensor_id, address, bus, config)
         self._last_pressure = 1013.25  # Sea level standard
+        self._calib = None
+        self._last_temp_c = 0.0
+
+    async def initialize(self) -> bool:
+        """Initialize the sensor and cache its calibration constants."""
+        result = await super().initialize()
+        if result and self._i2c:
+            # dig_T1..dig_P9 are factory-programmed and never change;
+            # reading them once here removes ~26 redundant register
+            # reads from every compensated sample.
+            raw = await self.aio_read_block(self._REG_CALIB, 24)
+            self._calib = struct.unpack('<HhhHhhhhhhhh', bytes(raw))
+            # Warm up the (possibly jitted) kernel here so the first
+            # real read doesn't pay the compile cost
+            self._compensate(519888, 415148)
+        return result
     
     @property
     def sensor_type(self) -> str:
@@ -31,21 +60,42 @@ class PressureSensor(I2CSensor):
     def unit(self) -> str:
         return "hPa"
     
-    async def read(self) -> SensorReading:
+    async def _read_impl(self, timestamp: int = None) -> SensorReading:
         """Read atmospheric pressure."""
         try:
-            # Simulate slow pressure changes
-            drift = random.gauss(0, 0.1)
-            self._last_pressure = max(980, min(1050, self._last_pressure + drift))
-            value = round(self._last_pressure, 2)
+            if self._i2c:
+                # One 6-byte burst fetches the pressure and temperature
+                # ADC words together instead of six per-register
+                # handshakes on the bus.
+                raw = await self.aio_read_block(self._REG_DATA, 6)
+                adc_p = (raw[0] << 12) | (raw[1] << 4) | (raw[2] >> 4)
+                adc_t = (raw[3] << 12) | (raw[4] << 4) | (raw[5] >> 4)
+                self._last_pressure = self._compensate(adc_t, adc_p)
+            else:
+                # Simulate slow pressure changes
+                drift = next_gauss(0, 0.1)
+                self._last_pressure = max(980, min(1050, self._last_pressure + drift))
+            value = fixed_round(self._last_pressure, 100.0)
             
-            metadata = {
-                'altitude_approx_m': round((1013.25 - value) * 8.3, 0),
-                'trend': 'stable'
-            }
+            metadata = dict(zip(self._META_KEYS, (
+                fixed_round((1013.25 - value) * 8.3, 1.0), 'stable')))
             
-            return self._create_reading(value, 1.0, metadata)
+            return self._create_reading(value, 1.0, metadata, timestamp)
             
         except Exception as e:
-            self.logger.error(f"Pressure read error: {e}")
-            return self._create_reading(0.0, 0.0, {'error': str(e)})
+            self.logger.error("Pressure read error: %s", e)
+            return self._create_reading(0.0, 0.0, {'error': str(e)}, timestamp)
+
+    def _compensate(self, adc_t: int, adc_p: int) -> float:
+        """Convert raw ADC words to pressure in hPa.
+
+        Delegates the Bosch datasheet math to the _bmp280 kernel
+        (numba-jitted when available), using the calibration constants
+        cached at initialize(); the compensated temperature is kept for
+        reuse. Falls back to a crude scale when no calibration is
+        available (mock mode).
+        """
+        if not self._calib:
+            return adc_p / 256.0
+        self._last_temp_c, pressure_pa = compensate(adc_t, adc_p, *self._calib)
+        return pressure_pa / 100.0  # Pa -> hPa
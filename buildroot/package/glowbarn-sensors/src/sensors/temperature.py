@@ -3,9 +3,10 @@ Temperature Sensor for GlowBarn OS.
 Supports DS18B20, DHT series, and I2C temperature sensors.
 """
 
-import random
 from typing import Any, Dict
-from .base import SensorBase, SensorReading, GPIOSensor
+import numpy as np
+from ._noise import next_gauss, next_uniform
+from .base import SensorBase, SensorReading, GPIOSensor, fixed_round
 
 
 class TemperatureSensor(GPIOSensor):
@@ -17,6 +18,10 @@ class TemperatureSensor(GPIOSensor):
     - DHT11/DHT22 temperature/humidity combo
     - BMP280/BME280 via I2C
     """
+
+    # Slow-drifting channel: reuse unchanged readings (see SensorBase)
+    _reuse_unchanged = True
+    _META_KEYS = ('model', 'cold_spot_detected', 'baseline', 'deviation')
     
     def __init__(self, sensor_id: str, pin: int, sensor_model: str = "ds18b20",
                  unit_format: str = "fahrenheit", config: Dict[str, Any] = None):
@@ -37,10 +42,10 @@ class TemperatureSensor(GPIOSensor):
         """Initialize temperature sensor."""
         result = await super().initialize()
         if result:
-            self.logger.info(f"Temperature sensor ({self.sensor_model}) ready")
+            self.logger.info("Temperature sensor (%s) ready", self.sensor_model)
         return result
     
-    async def read(self) -> SensorReading:
+    async def _read_impl(self, timestamp: int = None) -> SensorReading:
         """
         Read current temperature.
         
@@ -51,34 +56,31 @@ class TemperatureSensor(GPIOSensor):
         """
         try:
             # Simulate realistic temperature with slight drift
-            drift = random.gauss(0, 0.3)
+            drift = next_gauss(0, 0.3)
             self._last_temp = max(40.0, min(100.0, self._last_temp + drift))
             
             # Occasional cold spot simulation (for demo)
             cold_spot = 0.0
-            if random.random() < 0.01:  # 1% chance
-                cold_spot = random.uniform(5.0, 15.0)
+            if next_uniform() < 0.01:  # 1% chance
+                cold_spot = next_uniform(5.0, 15.0)
             
-            value = round(self._last_temp - cold_spot, 1)
+            value = fixed_round(self._last_temp - cold_spot, 10.0)
             
             # Convert if needed
             if self.unit_format == "celsius":
-                value = round((value - 32) * 5/9, 1)
+                value = fixed_round((value - 32) * 5/9, 10.0)
             
             quality = 1.0
             
-            metadata = {
-                'model': self.sensor_model,
-                'cold_spot_detected': cold_spot > 5.0,
-                'baseline': self._last_temp,
-                'deviation': -cold_spot if cold_spot else 0
-            }
+            metadata = dict(zip(self._META_KEYS, (
+                self.sensor_model, cold_spot > 5.0, self._last_temp,
+                -cold_spot if cold_spot else 0)))
             
-            return self._create_reading(value, quality, metadata)
+            return self._create_reading(value, quality, metadata, timestamp)
             
         except Exception as e:
-            self.logger.error(f"Temperature read error: {e}")
-            return self._create_reading(0.0, 0.0, {'error': str(e)})
+            self.logger.error("Temperature read error: %s", e)
+            return self._create_reading(0.0, 0.0, {'error': str(e)}, timestamp)
     
     def detect_cold_spot(self, readings: list) -> bool:
         """
@@ -91,10 +93,9 @@ class TemperatureSensor(GPIOSensor):
         """
         if len(readings) < 3:
             return False
-        
-        # Check for sudden drop
-        for i in range(1, len(readings)):
-            if readings[i-1].value - readings[i].value > 5.0:
-                return True
-        
-        return False
+
+        # One vectorized pass over the window instead of a Python-level
+        # comparison per sample
+        vals = np.fromiter((r.value for r in readings), dtype=np.float32,
+                           count=len(readings))
+        return bool((vals[:-1] - vals[1:]).max() > 5.0)
@@ -2,9 +2,9 @@
 Vibration Sensor for GlowBarn OS.
 """
 
-import random
 from typing import Any, Dict
-from .base import GPIOSensor, SensorReading
+from ._noise import next_gauss, next_uniform
+from .base import GPIOSensor, SensorReading, fixed_round
 
 
 class VibrationSensor(GPIOSensor):
@@ -12,6 +12,8 @@ class VibrationSensor(GPIOSensor):
     Vibration/seismic sensor for detecting physical disturbances.
     """
     
+    _META_KEYS = ('alert',)
+
     @property
     def sensor_type(self) -> str:
         return "vibration"
@@ -20,24 +22,22 @@ class VibrationSensor(GPIOSensor):
     def unit(self) -> str:
         return "g"  # Acceleration in g-force
     
-    async def read(self) -> SensorReading:
+    async def _read_impl(self, timestamp: int = None) -> SensorReading:
         """Read vibration level."""
         try:
             # Baseline ambient vibration
-            value = abs(random.gauss(0.01, 0.005))
+            value = abs(next_gauss(0.01, 0.005))
             
             # Occasional spike
-            if random.random() < 0.005:
-                value += random.uniform(0.1, 0.5)
+            if next_uniform() < 0.005:
+                value += next_uniform(0.1, 0.5)
             
-            value = round(value, 4)
+            value = fixed_round(value, 10000.0)
             
-            metadata = {
-                'alert': value > 0.1
-            }
+            metadata = dict(zip(self._META_KEYS, (value > 0.1,)))
             
-            return self._create_reading(value, 1.0, metadata)
+            return self._create_reading(value, 1.0, metadata, timestamp)
             
         except Exception as e:
-            self.logger.error(f"Vibration read error: {e}")
-            return self._create_reading(0.0, 0.0, {'error': str(e)})
+            self.logger.error("Vibration read error: %s", e)
+            return self._create_reading(0.0, 0.0, {'error': str(e)}, timestamp)
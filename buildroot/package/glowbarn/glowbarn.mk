@@ -11,7 +11,7 @@ GLOWBARN_LICENSE = GPL-3.0
 GLOWBARN_LICENSE_FILES = LICENSE
 
 # Python-based application
-GLOWBARN_DEPENDENCIES = python3 python-flask python-pyyaml python-flask-cors
+GLOWBARN_DEPENDENCIES = python3 python-aiohttp python-pyyaml python-numpy
 
 # No build needed - Python scripts
 define GLOWBARN_BUILD_CMDS